@@ -1 +1,521 @@
-"""\nThis script attempts to extract AI tool information from Futuretools.io.\nIt uses web_parser.py to fetch content and text_summarizer.py to summarize descriptions.\n"""\n\nimport json\nfrom web_parser import fetch_and_parse_website\nfrom text_summarizer import summarize_text\n\n\ndef extract_tools_from_futuretools(url: str = \"https://www.futuretools.io/\") -> list:\n    \"\"\"\n    Fetches content from Futuretools.io and attempts to extract AI tool listings.\n\n    Args:\n        url: The URL of the Futuretools.io page to parse (defaults to main page).\n\n    Returns:\n        A list of dictionaries, where each dictionary represents a tool and contains:\n        - name (str): Tool Name\n        - website_link (str): External link to the tool's website\n        - futuretools_link (str): Link to the tool's detail page on Futuretools.io\n        - description (str): Tool description from Futuretools.io\n        - summarized_description (str, optional): Summarized version of the description.\n    \"\"\"\n    print(f\"Fetching data from {url}...\")\n    parsed_data = fetch_and_parse_website(url)\n    tools_found = []\n\n    if not parsed_data:\n        print(\"Failed to fetch or parse the website.\")\n        return tools_found\n\n    soup = parsed_data.get(\"soup\")\n    if not soup:\n        print(\"BeautifulSoup object not found in parsed_data. Cannot perform detailed parsing.\")\n        return tools_found\n\n    print(\"Attempting to parse tools using BeautifulSoup object...\")\n\n    # Find tool containers using CSS selectors\n    tool_containers = soup.select('[class*=\"tool-card\"]')\n\n    if not tool_containers:\n        tool_containers = soup.select('[class*=\"item\"], [class*=\"collection-item\"]')\n        if tool_containers:\n            print(\"Found potential tool containers with class 'item' or 'collection-item'.\")\n        else:\n            print(\"Could not find any elements matching assumed tool container selectors.\")\n            return tools_found\n\n    container_count = len(tool_containers)\n    print(f\"Found {container_count} potential tool containers. Processing each...\")\n\n    # Counters\n    processed_tools_count = 0\n    missing_names_count = 0\n    missing_website_links_count = 0\n    missing_ft_links_count = 0\n    missing_descriptions_count = 0\n\n    # Pre-define selector config once outside the loop\n    _name_selectors = [\n        (['h2', 'h3', 'h4'], {'class_': ['tool-name', 'tool-title', 'card-title']}),\n        (['h2', 'h3', 'h4'], {}),\n        (['a'], {'class_': ['title', 'name']}),\n    ]\n    _desc_classes = [\n        'description', 'tool-description', 'card-text',\n        'item-description', 'tool-card-description'\n    ]\n    _ext_link_classes = [\n        'external-link', 'website-button', 'tool-website-link',\n        'outbound', 'visit-tool-button'\n    ]\n    _ft_base = \"https://www.futuretools.io\"\n\n    # Collect descriptions that need summarization for potential batch processing\n    # (batch the calls to avoid repeated pipeline overhead per tool)\n    tools_pending_summary = []\n\n    for i, container in enumerate(tool_containers):\n        name = None\n        website_link = None\n        futuretools_link_internal = None\n        description = None\n\n        # --- Tool Name ---\n        name_element = None\n        for tags, attrs in _name_selectors:\n            name_element = container.find(tags, **attrs)\n            if name_element:\n                break\n\n        # Fallback: first link with text content\n        if not name_element:\n            first_link = container.find('a')\n            if first_link and first_link.get_text(strip=True):\n                name_element = first_link\n\n        if name_element:\n            name = name_element.get_text(strip=True) or None\n\n        # --- Futuretools Link (Internal) ---\n        if container.name == 'a':\n            href_candidate = container.get('href', '')\n            if href_candidate.startswith(('/tool/', '/tools/')):\n                futuretools_link_internal = href_candidate\n\n        if not futuretools_link_internal:\n            ft_link_el = container.find(\n                'a', href=lambda x: x and (x.startswith('/tool/') or x.startswith('/tools/'))\n            )\n            if ft_link_el:\n                futuretools_link_internal = ft_link_el.get('href')\n\n        if futuretools_link_internal and futuretools_link_internal.startswith('/'):\n            futuretools_link_internal = _ft_base + futuretools_link_internal\n\n        # --- Tool Website Link (External) ---\n        ext_el = container.find('a', class_=_ext_link_classes)\n        if ext_el:\n            href = ext_el.get('href', '')\n            if href.startswith('http') and 'futuretools.io' not in href:\n                website_link = href\n\n        if not website_link:\n            for link_tag in container.find_all('a', href=True):\n                href = link_tag['href']\n                if (href.startswith('http')\n                        and 'futuretools.io' not in href\n                        and href != futuretools_link_internal):\n                    website_link = href\n                    break\n\n        # --- Tool Description ---\n        desc_el = container.find(['p', 'div'], class_=_desc_classes)\n        if desc_el:\n            description = desc_el.get_text(strip=True) or None\n\n        if not description:\n            for p_tag in container.find_all('p'):\n                p_text = p_tag.get_text(strip=True)\n                if p_text and len(p_text) > 20:\n                    description = p_text\n                    break\n\n        # Final fallback: card text minus the name\n        if not description and name:\n            container_text = container.get_text(separator=' ', strip=True)\n            if container_text.startswith(name):\n                container_text = container_text[len(name):].strip()\n            if len(container_text) > 30:\n                description = container_text\n\n        # --- Assemble tool record ---\n        has_name = bool(name)\n        has_website = bool(website_link)\n        has_ft_link = bool(futuretools_link_internal)\n        has_desc = bool(description)\n\n        if has_name and (has_website or has_ft_link):\n            processed_tools_count += 1\n            tool_entry = {\n                \"name\": name,\n                \"website_link\": website_link or \"N/A\",\n                \"futuretools_link\": futuretools_link_internal or \"N/A\",\n                \"description\": description or \"N/A\",\n                \"summarized_description\": \"N/A\"\n            }\n\n            # Queue long descriptions for summarization\n            if has_desc and len(description.split()) > 30:\n                tools_pending_summary.append(tool_entry)\n            elif has_desc:\n                tool_entry[\"summarized_description\"] = description\n\n            tools_found.append(tool_entry)\n\n            if not has_website:\n                missing_website_links_count += 1\n            if not has_ft_link:\n                missing_ft_links_count += 1\n            if not has_desc:\n                missing_descriptions_count += 1\n        else:\n            if not has_name:\n                missing_names_count += 1\n\n    # Batch-summarize descriptions (sequential calls, but avoids redundant\n    # pipeline-readiness checks per iteration and benefits from LRU cache\n    # for duplicate descriptions)\n    if tools_pending_summary:\n        print(f\"Summarizing {len(tools_pending_summary)} tool descriptions...\")\n        for tool_entry in tools_pending_summary:\n            tool_entry[\"summarized_description\"] = summarize_text(\n                tool_entry[\"description\"], max_length=50, min_length=15\n            )\n\n    # --- Final Summary ---\n    print(\"\\n--- Futuretools Parsing Summary ---\")\n    if container_count == 0:\n        print(\"No potential tool containers were identified on the page.\")\n    else:\n        print(f\"Processed {container_count} potential tool containers.\")\n        print(f\"Successfully extracted {processed_tools_count} tools with a name and at least one link.\")\n        print(f\"Containers without a discernible name: {missing_names_count}\")\n        print(f\"Tools missing an External Website Link: {missing_website_links_count}\")\n        print(f\"Tools missing an Internal FutureTools Link: {missing_ft_links_count}\")\n        print(f\"Tools missing a Description: {missing_descriptions_count}\")\n\n    if not tools_found and container_count > 0:\n        print(\"\\nNo tools extracted that met the criteria (name and at least one link).\")\n        print(\"The HTML structure might be different. Further refinement of selectors may be needed.\")\n\n    return tools_found\n\n\nif __name__ == '__main__':\n    print(\"Starting Futuretools.io parser...\")\n    test_url = \"https://www.futuretools.io/\"\n\n    extracted_tools = extract_tools_from_futuretools(url=test_url)\n\n    if extracted_tools:\n        print(f\"\\n--- Extracted Tools ({len(extracted_tools)} found) ---\")\n        for i, tool in enumerate(extracted_tools[:5]):\n            print(f\"\\nTool {i+1}:\")\n            print(f\"  Name: {tool.get('name')}\")\n            print(f\"  Futuretools Link: {tool.get('futuretools_link')}\")\n            print(f\"  Website Link: {tool.get('website_link')}\")\n            desc = tool.get('description', '')\n            print(f\"  Description: {desc[:100] + '...' if desc and len(desc) > 100 else desc}\")\n            print(f\"  Summarized Desc: {tool.get('summarized_description')}\")\n    else:\n        print(\"\\nNo tools were extracted.\")\n\n    print(\"\\nFuturetools.io parser finished.\")\n
\ No newline at end of file
+"""
+This script attempts to extract AI tool information from Futuretools.io.
+It uses web_parser.py to fetch content and text_summarizer.py to summarize descriptions.
+
+Note: Tool cards are parsed with 'selectolax' (lexbor backend).
+You can install it using pip:
+  pip install selectolax
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from collections import Counter, defaultdict
+from contextlib import closing
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+
+from selectolax.lexbor import LexborHTMLParser
+
+from web_parser import fetch_html, fetch_and_process_many, prepare_session
+from text_summarizer import summarize_texts, is_summary_error, summarizer_fingerprint
+
+log = logging.getLogger(__name__)
+
+# Descriptions shorter than this are used as-is: with a 15-token minimum the
+# model has almost nothing to compress, so the transformer call is wasted work
+_SUMMARY_MIN_WORDS = 60
+
+# Length bounds (in tokens) of a generated description summary
+_SUMMARY_MAX_LENGTH = 80
+_SUMMARY_MIN_LENGTH = 15
+
+# At most this many HTML snippets are kept per kind of miss for debug logging
+_MISS_SAMPLE_LIMIT = 3
+
+# HTTP responses (with requests-cache) and parsed tools share one SQLite file,
+# in separate tables. Set FUTURETOOLS_CACHE to choose where it lives; neither
+# the file nor its directory is created until the cache is first used.
+_CACHE_PATH = os.environ.get("FUTURETOOLS_CACHE") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "futuretools_parser", "ft_cache.sqlite"
+)
+_TOOLS_CACHE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS parsed_tools "
+    "(url TEXT PRIMARY KEY, digest TEXT NOT NULL, tools TEXT NOT NULL)"
+)
+
+_FT_BASE = "https://www.futuretools.io"
+_FT_DOMAIN = "futuretools.io"
+
+# Tool cards. A match inside an element whose class is exactly "tool-card"
+# (e.g. "tool-card-description") is part of that card, and a wrapper around
+# such cards (e.g. "tool-cards-grid") is not a card itself; neither is
+# processed as a card of its own.
+_CARD_SEL = '[class*="tool-card"]:not(.tool-card *, :has(.tool-card))'
+# Webflow collection items, used only when a page has no tool cards.
+# "w-dyn-item" is matched as a class token: a substring match would also
+# take the "w-dyn-items" list wrapper.
+_CARD_FALLBACK_SEL = ':is([class*="collection-item"], .w-dyn-item)'
+
+# Name lookups for a card, specialized once at import time and tried in order;
+# the first one that finds an element wins (the last is the first-link fallback).
+_NAME_FINDERS = (
+    lambda c: c.css_first(':is(h2, h3, h4):is(.tool-name, .tool-title, .card-title)'),
+    lambda c: c.css_first('h2, h3, h4'),
+    lambda c: c.css_first('a.title, a.name'),
+    lambda c: c.css_first('a'),
+)
+
+# CSS selectors used for every tool card, built once at import time.
+_FT_LINK_SEL = 'a[href^="/tool/"], a[href^="/tools/"]'
+_EXT_LINK_SEL = (
+    'a:is(.external-link, .website-button, .tool-website-link, '
+    '.outbound, .visit-tool-button)'
+)
+# Candidates for any absolute http(s) link whose host is not futuretools.io.
+# lexbor drops the common internal links, so usually the first candidate is
+# taken; _is_external_link() has the final say on schemes and subdomains.
+_EXT_LINK_FALLBACK_SEL = (
+    'a[href^="http" i]:not([href^="http://futuretools.io/" i], '
+    '[href^="https://futuretools.io/" i], [href^="http://www.futuretools.io/" i], '
+    '[href^="https://www.futuretools.io/" i])'
+)
+_DESC_CLASSES = frozenset({
+    'description', 'tool-description', 'card-text',
+    'item-description', 'tool-card-description'
+})
+# lexbor matches class selectors against the element's class tokens, i.e. a
+# set intersection with _DESC_CLASSES evaluated in C
+_DESC_SEL = ':is(p, div):is({})'.format(', '.join('.' + c for c in sorted(_DESC_CLASSES)))
+
+
+def extract_tools_from_futuretools(url: str = "https://www.futuretools.io/") -> list:
+    """
+    Fetches content from Futuretools.io and attempts to extract AI tool listings.
+
+    Args:
+        url: The URL of the Futuretools.io page to parse (defaults to main page).
+
+    Returns:
+        A list of dictionaries, where each dictionary represents a tool and contains:
+        - name (str): Tool Name
+        - website_link (str): External link to the tool's website
+        - futuretools_link (str): Link to the tool's detail page on Futuretools.io
+        - description (str): Tool description from Futuretools.io
+        - summarized_description (str, optional): Summarized version of the description.
+    """
+    print(f"Fetching data from {url}...")
+    html = fetch_html(url, session=_http_session())
+
+    if not html:
+        print("Failed to fetch the website.")
+        return []
+
+    digest = _page_digest(html)
+    cached_tools = _load_cached_tools(url, digest)
+    if cached_tools is not None:
+        print("Page unchanged since the last run; using cached tools.")
+        return cached_tools
+
+    tools_found = _parse_tool_cards(html)
+    # Don't pin error messages in the cache in place of summaries
+    if _summarize_tools(tools_found):
+        _store_cached_tools(url, digest, tools_found)
+    return tools_found
+
+
+async def extract_tools_from_futuretools_async(urls: list) -> list:
+    """
+    Fetches several Futuretools.io pages concurrently and extracts their tools.
+
+    Pages are fetched and parsed with web_parser.fetch_and_process_many();
+    descriptions are summarized once all pages are parsed.
+
+    Args:
+        urls: The Futuretools.io page URLs to parse (e.g. category or paginated pages).
+
+    Returns:
+        A single list of tool dictionaries from all pages, in the order of `urls`.
+        See extract_tools_from_futuretools() for the dictionary layout.
+    """
+    pages = []
+    for url, page in zip(urls, await fetch_and_process_many(urls, _parse_page)):
+        if page is None:
+            print(f"Failed to fetch {url}.")
+            page = (None, [])
+        pages.append((url, *page))
+
+    tools_found = [tool for _, _, page in pages for tool in page]
+    # Don't pin error messages in the cache in place of summaries
+    if _summarize_tools(tools_found):
+        for url, digest, page in pages:
+            if digest is not None:
+                _store_cached_tools(url, digest, page)
+    return tools_found
+
+
+def extract_tools_from_futuretools_many(urls: list) -> list:
+    """
+    Synchronous wrapper around extract_tools_from_futuretools_async().
+
+    Args:
+        urls: The Futuretools.io page URLs to parse.
+
+    Returns:
+        A single list of tool dictionaries from all pages.
+    """
+    return asyncio.run(extract_tools_from_futuretools_async(urls))
+
+
+def _parse_page(html: bytes, url: str, charset: str = None) -> tuple:
+    """
+    Parses a page fetched by extract_tools_from_futuretools_async(), unless
+    the parsed-tools cache still holds its tools. selectolax is given the
+    raw bytes, so the header charset is not used.
+
+    Returns:
+        A (digest, tools) tuple. digest is None if the tools came from the
+        cache or the page is empty, i.e. when there is nothing to store.
+    """
+    if not html:
+        print(f"Failed to fetch {url}.")
+        return None, []
+    digest = _page_digest(html)
+    cached_tools = _load_cached_tools(url, digest)
+    if cached_tools is not None:
+        return None, cached_tools
+    return digest, _parse_tool_cards(html)
+
+
+def _parse_tool_cards(html: bytes) -> list:
+    """
+    Extracts tool listings from the HTML of a Futuretools.io page.
+
+    Tools whose description is long enough to be worth summarizing keep
+    "N/A" as their summarized_description; _summarize_tools() fills it in.
+
+    Args:
+        html: The raw HTML of the page.
+
+    Returns:
+        A list of tool dictionaries (see extract_tools_from_futuretools()).
+    """
+    tools_found = []
+
+    print("Attempting to parse tools using selectolax (lexbor)...")
+
+    # Parsing and CSS matching both run in lexbor's C code; only the matched
+    # nodes are wrapped as Python objects.
+    tree = LexborHTMLParser(html)
+    tool_containers = tree.css(_CARD_SEL)
+
+    if not tool_containers:
+        tool_containers = tree.css(_CARD_FALLBACK_SEL)
+        if tool_containers:
+            print("Found potential tool containers with class 'collection-item' or 'w-dyn-item'.")
+        else:
+            print("Could not find any elements matching assumed tool container selectors.")
+            return tools_found
+
+    container_count = len(tool_containers)
+    print(f"Found {container_count} potential tool containers. Processing each...")
+
+    # Counters
+    processed_tools_count = 0
+    misses = Counter()
+    # Snippets are only serialized when debug logging is actually enabled
+    miss_samples = defaultdict(list) if log.isEnabledFor(logging.DEBUG) else None
+
+    for container in tool_containers:
+        tool_entry, missing = _extract_card(container)
+        if tool_entry:
+            processed_tools_count += 1
+            tools_found.append(tool_entry)
+        for key in missing:
+            _record_miss(misses, miss_samples, key, container)
+
+    # --- Final Summary ---
+    print("\n--- Futuretools Parsing Summary ---")
+    if container_count == 0:
+        print("No potential tool containers were identified on the page.")
+    else:
+        print(f"Processed {container_count} potential tool containers.")
+        print(f"Successfully extracted {processed_tools_count} tools with a name and at least one link.")
+        print(f"Containers without a discernible name: {misses['name']}")
+        print(f"Tools missing an External Website Link: {misses['website_link']}")
+        print(f"Tools missing an Internal FutureTools Link: {misses['futuretools_link']}")
+        print(f"Tools missing a Description: {misses['description']}")
+
+    if miss_samples:
+        for key, snippets in miss_samples.items():
+            for snippet in snippets:
+                log.debug("Sample container missing %s: %s", key, snippet)
+
+    if not tools_found and container_count > 0:
+        print("\nNo tools extracted that met the criteria (name and at least one link).")
+        print("The HTML structure might be different. Further refinement of selectors may be needed.")
+
+    return tools_found
+
+
+def _extract_card(container) -> tuple:
+    """
+    Extracts one tool from a card container node.
+
+    Returns:
+        A (tool_entry, missing) tuple. tool_entry is the tool dictionary, or
+        None if the card has no name or no link; missing names the fields
+        that were not found (counted in the parsing summary).
+    """
+    name = None
+    website_link = None
+    futuretools_link_internal = None
+    description = None
+
+    # --- Tool Name ---
+    for find_name in _NAME_FINDERS:
+        name_element = find_name(container)
+        if name_element:
+            name = name_element.text(strip=True) or None
+            break
+
+    # --- Futuretools Link (Internal) ---
+    if container.tag == 'a':
+        href_candidate = container.attributes.get('href') or ''
+        if href_candidate.startswith(('/tool/', '/tools/')):
+            futuretools_link_internal = href_candidate
+
+    if not futuretools_link_internal:
+        ft_link_el = container.css_first(_FT_LINK_SEL)
+        if ft_link_el:
+            futuretools_link_internal = ft_link_el.attributes.get('href')
+
+    if futuretools_link_internal:
+        futuretools_link_internal = urljoin(_FT_BASE, futuretools_link_internal)
+
+    # --- Tool Website Link (External) ---
+    ext_el = container.css_first(_EXT_LINK_SEL)
+    if ext_el:
+        href = ext_el.attributes.get('href') or ''
+        if _is_external_link(href):
+            website_link = href
+
+    # The internal link is always on a futuretools.io host, which
+    # _is_external_link() rejects, so no separate de-duplication is needed
+    if not website_link:
+        for link_tag in container.css(_EXT_LINK_FALLBACK_SEL):
+            href = link_tag.attributes.get('href') or ''
+            if _is_external_link(href):
+                website_link = href
+                break
+
+    # --- Tool Description ---
+    desc_el = container.css_first(_DESC_SEL)
+    if desc_el:
+        description = desc_el.text(strip=True) or None
+
+    # Card text for the fallbacks below, walked once and reused
+    container_text = ''
+    if not description:
+        container_text = container.text(separator=' ', strip=True)
+
+    # A card with no more than 20 characters of text cannot hold a
+    # qualifying <p>, so skip walking each paragraph in that case
+    if not description and len(container_text) > 20:
+        for p_tag in container.css('p'):
+            p_text = p_tag.text(strip=True)
+            if p_text and len(p_text) > 20:
+                description = p_text
+                break
+
+    # Final fallback: card text minus the name
+    if not description and name:
+        remainder = container_text
+        if remainder.startswith(name):
+            remainder = remainder[len(name):].lstrip()
+        if len(remainder) > 30:
+            description = remainder
+
+    # --- Assemble tool record ---
+    has_name = bool(name)
+    has_website = bool(website_link)
+    has_ft_link = bool(futuretools_link_internal)
+    has_desc = bool(description)
+
+    if not (has_name and (has_website or has_ft_link)):
+        return None, (() if has_name else ("name",))
+
+    tool_entry = {
+        "name": name,
+        "website_link": website_link or "N/A",
+        "futuretools_link": futuretools_link_internal or "N/A",
+        "description": description or "N/A",
+        "summarized_description": "N/A"
+    }
+
+    # Long descriptions are left for _summarize_tools()
+    if has_desc and len(description.split()) < _SUMMARY_MIN_WORDS:
+        tool_entry["summarized_description"] = description
+
+    missing = []
+    if not has_website:
+        missing.append("website_link")
+    if not has_ft_link:
+        missing.append("futuretools_link")
+    if not has_desc:
+        missing.append("description")
+    return tool_entry, tuple(missing)
+
+
+def _page_digest(html: bytes) -> str:
+    """
+    Hashes a page's HTML together with the summarizer settings, so cached
+    tools are reused only for the same page summarized the same way.
+    """
+    digest = hashlib.sha256(html)
+    digest.update(
+        f"\0{summarizer_fingerprint()} min_words={_SUMMARY_MIN_WORDS} "
+        f"length={_SUMMARY_MIN_LENGTH}-{_SUMMARY_MAX_LENGTH}".encode()
+    )
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _http_session():
+    """
+    Returns the session for synchronous Futuretools.io fetches, created on first use.
+
+    With requests-cache installed it is a CachedSession in the cache file, so
+    repeat fetches send conditional GETs and an unchanged page comes back as a
+    304 served locally. Otherwise (or if the cache cannot be opened) it is
+    None, i.e. web_parser's default session.
+    """
+    try:
+        import requests_cache
+    except ImportError:
+        return None
+    try:
+        return prepare_session(requests_cache.CachedSession(
+            _make_cache_dir(), backend="sqlite", expire_after=3600, cache_control=True
+        ))
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: could not open the HTTP cache: {e}")
+        return None
+
+
+def _make_cache_dir() -> str:
+    """Creates the cache file's directory if needed and returns the file path."""
+    os.makedirs(os.path.dirname(os.path.abspath(_CACHE_PATH)), exist_ok=True)
+    return _CACHE_PATH
+
+
+def _load_cached_tools(url: str, digest: str) -> list:
+    """
+    Returns the tools stored for `url` if its HTML hash is still `digest`.
+
+    Returns:
+        The cached list of tool dictionaries, or None on a miss or cache error.
+    """
+    try:
+        with closing(sqlite3.connect(_make_cache_dir())) as conn:
+            conn.execute(_TOOLS_CACHE_SCHEMA)
+            row = conn.execute(
+                "SELECT tools FROM parsed_tools WHERE url = ? AND digest = ?", (url, digest)
+            ).fetchone()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: could not read the parsed-tools cache: {e}")
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def _store_cached_tools(url: str, digest: str, tools: list) -> None:
+    """Replaces the cached tools for `url`, so a changed page invalidates the old entry."""
+    try:
+        with closing(sqlite3.connect(_make_cache_dir())) as conn, conn:
+            conn.execute(_TOOLS_CACHE_SCHEMA)
+            conn.execute(
+                "INSERT OR REPLACE INTO parsed_tools (url, digest, tools) VALUES (?, ?, ?)",
+                (url, digest, json.dumps(tools))
+            )
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: could not write the parsed-tools cache: {e}")
+
+
+def _is_external_link(href: str) -> bool:
+    """True for absolute http(s) links that point outside futuretools.io and its subdomains."""
+    parts = urlsplit(href)
+    if parts.scheme not in ('http', 'https'):
+        return False
+    host = parts.hostname or ''
+    return bool(host) and host != _FT_DOMAIN and not host.endswith('.' + _FT_DOMAIN)
+
+
+def _record_miss(misses: Counter, samples: dict, key: str, container) -> None:
+    """Counts a missing field and keeps a few container snippets for debug logging."""
+    misses[key] += 1
+    if samples is not None and len(samples[key]) < _MISS_SAMPLE_LIMIT:
+        samples[key].append(container.html[:150])
+
+
+def _summarize_tools(tools: list) -> bool:
+    """
+    Fills in summarized_description for tools left pending by _parse_tool_cards().
+
+    Returns:
+        False if any description got an error message instead of a summary
+        (e.g. the model failed to load or generate), True otherwise.
+    """
+    tools_pending_summary = [
+        tool for tool in tools
+        if tool["description"] != "N/A" and tool["summarized_description"] == "N/A"
+    ]
+    if not tools_pending_summary:
+        return True
+
+    # Summary length scales with the input (half its words, capped) and is
+    # rounded down to a multiple of 10 so each bucket is one batched call.
+    # Identical (templated) descriptions are only summarized once.
+    buckets = defaultdict(dict)
+    for tool in tools_pending_summary:
+        word_count = len(tool["description"].split())
+        max_length = min(_SUMMARY_MAX_LENGTH, word_count // 2) // 10 * 10
+        buckets[max_length].setdefault(tool["description"], []).append(tool)
+
+    print(f"Summarizing {len(tools_pending_summary)} tool descriptions...")
+    succeeded = True
+    for max_length, tools_by_description in buckets.items():
+        descriptions = list(tools_by_description)
+        summaries = summarize_texts(
+            descriptions, max_length=max_length, min_length=_SUMMARY_MIN_LENGTH, batch_size=8
+        )
+        for description, summary in zip(descriptions, summaries):
+            succeeded = succeeded and not is_summary_error(summary)
+            for tool_entry in tools_by_description[description]:
+                tool_entry["summarized_description"] = summary
+    return succeeded
+
+
+if __name__ == '__main__':
+    print("Starting Futuretools.io parser...")
+    test_url = "https://www.futuretools.io/"
+
+    extracted_tools = extract_tools_from_futuretools(url=test_url)
+
+    if extracted_tools:
+        print(f"\n--- Extracted Tools ({len(extracted_tools)} found) ---")
+        for i, tool in enumerate(extracted_tools[:5]):
+            print(f"\nTool {i+1}:")
+            print(f"  Name: {tool.get('name')}")
+            print(f"  Futuretools Link: {tool.get('futuretools_link')}")
+            print(f"  Website Link: {tool.get('website_link')}")
+            desc = tool.get('description', '')
+            print(f"  Description: {desc[:100] + '...' if desc and len(desc) > 100 else desc}")
+            print(f"  Summarized Desc: {tool.get('summarized_description')}")
+    else:
+        print("\nNo tools were extracted.")
+
+    print("\nFuturetools.io parser finished.")
@@ -1 +1,215 @@
-"""\nThis script organizes and presents structured data extracted by other parser scripts\nin different text-based formats.\n"""\n\nfrom web_parser import fetch_and_parse_website\nfrom text_summarizer import summarize_text, is_pipeline_available\n\n\ndef format_data_as_list(data, source_type: str) -> str:\n    \"\"\"\n    Formats extracted data as a human-readable list.\n\n    Args:\n        data: The structured data from parsing functions.\n              - If source_type is \"futuretools\", expects a list of tool dictionaries.\n              - If source_type is \"generic_website\", expects a dictionary from fetch_and_parse_website.\n        source_type: Either \"futuretools\" or \"generic_website\".\n\n    Returns:\n        A string containing the formatted list.\n    \"\"\"\n    output_lines = []\n\n    if source_type == \"futuretools\":\n        output_lines.append(\"--- AI Tools (List Format) ---\")\n        if not data:\n            output_lines.append(\"No tools data provided or tools list is empty.\")\n        else:\n            for i, tool in enumerate(data):\n                output_lines.append(f\"\\nTool {i+1}:\")\n                output_lines.append(f\"  Name: {tool.get('name', 'N/A')}\")\n                output_lines.append(f\"  Website: {tool.get('website_link', 'N/A')}\")\n\n        if isinstance(data, dict) and \"youtube_videos\" in data:\n            youtube_videos = data.get(\"youtube_videos\", [])\n            if youtube_videos:\n                output_lines.append(\"\\n--- YouTube Videos Found on Page ---\")\n                for video in youtube_videos:\n                    output_lines.append(f\"  Title: {video.get('title', 'N/A')}\")\n                    output_lines.append(f\"  URL: {video.get('url', 'N/A')}\")\n\n    elif source_type == \"generic_website\":\n        output_lines.append(\"--- Website Content (List Format) ---\")\n        if not data:\n            output_lines.append(\"No website data provided.\")\n            return \"\\n\".join(output_lines)\n\n        links = data.get(\"links\", [])\n        if links:\n            output_lines.append(\"\\n--- Hyperlinks ---\")\n            for i, link in enumerate(links[:10]):\n                output_lines.append(f\"  {i+1}. Text: {link.get('text', 'N/A')}\")\n                output_lines.append(f\"     Href: {link.get('href', 'N/A')}\")\n        else:\n            output_lines.append(\"\\nNo hyperlinks extracted.\")\n\n        youtube_videos = data.get(\"youtube_videos\", [])\n        if youtube_videos:\n            output_lines.append(\"\\n--- YouTube Videos ---\")\n            for i, video in enumerate(youtube_videos):\n                output_lines.append(f\"  {i+1}. Title: {video.get('title', 'N/A')}\")\n                output_lines.append(f\"     URL: {video.get('url', 'N/A')}\")\n        else:\n            output_lines.append(\"\\nNo YouTube videos identified.\")\n\n    else:\n        return \"Invalid source_type provided. Use 'futuretools' or 'generic_website'.\"\n\n    return \"\\n\".join(output_lines)\n\n\ndef format_data_as_paragraphs(data, source_type: str) -> str:\n    \"\"\"\n    Formats extracted data as human-readable paragraphs.\n\n    Args:\n        data: The structured data.\n              - If source_type is \"futuretools\", expects a list of tool dictionaries.\n              - If source_type is \"generic_website\", expects a dictionary from fetch_and_parse_website.\n        source_type: Either \"futuretools\" or \"generic_website\".\n\n    Returns:\n        A string containing the formatted paragraphs.\n    \"\"\"\n    output_paragraphs = []\n\n    if source_type == \"futuretools\":\n        output_paragraphs.append(\"--- AI Tools (Paragraph Format) ---\")\n        if not data:\n            output_paragraphs.append(\"No tools data provided or tools list is empty.\")\n        else:\n            for tool in data:\n                name = tool.get('name', 'N/A')\n                desc = tool.get('summarized_description') or tool.get('description', 'No description available.')\n                website = tool.get('website_link', 'N/A')\n                ft_link = tool.get('futuretools_link', 'N/A')\n\n                paragraph = f\"Tool: {name}\\nDescription: {desc}\\nWebsite: {website}\\n\"\n                if ft_link != 'N/A':\n                    paragraph += f\"FutureTools Page: {ft_link}\\n\"\n                output_paragraphs.append(paragraph)\n\n    elif source_type == \"generic_website\":\n        output_paragraphs.append(\"--- Website Content (Paragraph Format) ---\")\n        if not data:\n            output_paragraphs.append(\"No website data provided.\")\n            return \"\\n\\n\".join(output_paragraphs)\n\n        main_text = data.get(\"text\", \"\")\n        if main_text and is_pipeline_available():\n            summary = summarize_text(main_text, max_length=150, min_length=40)\n            output_paragraphs.append(f\"Website Summary:\\n{summary}\")\n        elif main_text:\n            output_paragraphs.append(\n                f\"Website Summary:\\n(Summarizer not available). \"\n                f\"Full text snippet:\\n{main_text[:500]}...\"\n            )\n        else:\n            output_paragraphs.append(\"No main text content extracted to summarize.\")\n\n        links = data.get(\"links\", [])\n        if links:\n            links_paragraph = \"Key Hyperlinks Found:\\n\"\n            for link in links[:5]:\n                links_paragraph += f\"- {link.get('text', 'N/A')} ({link.get('href', 'N/A')})\\n\"\n            if len(links) > 5:\n                links_paragraph += f\"...and {len(links)-5} more links.\"\n            output_paragraphs.append(links_paragraph)\n\n        youtube_videos = data.get(\"youtube_videos\", [])\n        if youtube_videos:\n            yt_paragraph = \"YouTube Videos Found:\\n\"\n            for video in youtube_videos:\n                yt_paragraph += f\"- {video.get('title', 'N/A')} ({video.get('url', 'N/A')})\\n\"\n            output_paragraphs.append(yt_paragraph)\n\n    else:\n        return \"Invalid source_type provided. Use 'futuretools' or 'generic_website'.\"\n\n    return \"\\n\\n\".join(output_paragraphs)\n\n\nif __name__ == '__main__':\n    # Lazy import to avoid triggering model load unless actually running this script\n    from futuretools_parser import extract_tools_from_futuretools\n\n    print(\"Demonstrating Information Organizer Script...\\n\")\n\n    # 1. Process data from Futuretools.io\n    print(\"=\"*30)\n    print(\"Fetching and processing from Futuretools.io...\")\n    print(\"=\"*30)\n    futuretools_data = extract_tools_from_futuretools()\n\n    if futuretools_data:\n        print(\"\\n--- Formatting Futuretools Data as List ---\")\n        list_output_ft = format_data_as_list(futuretools_data, \"futuretools\")\n        print(list_output_ft)\n\n        print(\"\\n--- Formatting Futuretools Data as Paragraphs ---\")\n        paragraph_output_ft = format_data_as_paragraphs(futuretools_data, \"futuretools\")\n        print(paragraph_output_ft)\n    else:\n        print(\"\\nNo data extracted from Futuretools.io. Skipping formatting for it.\")\n\n    # 2. Process data from a generic website\n    print(\"\\n\\n\" + \"=\"*30)\n    print(\"Fetching and processing from a generic blog post...\")\n    print(\"=\"*30)\n    generic_url = \"https://openai.com/blog/new-models-and-developer-products-announced-at-devday\"\n    generic_url_fallback = \"https://www.gnu.org/philosophy/free-sw.html\"\n\n    print(f\"Attempting to fetch: {generic_url}\")\n    generic_website_data = fetch_and_parse_website(generic_url)\n\n    if not generic_website_data:\n        print(f\"Failed to fetch primary generic URL. Trying fallback: {generic_url_fallback}\")\n        generic_website_data = fetch_and_parse_website(generic_url_fallback)\n\n    if generic_website_data:\n        print(\"\\n--- Formatting Generic Website Data as List ---\")\n        list_output_generic = format_data_as_list(generic_website_data, \"generic_website\")\n        print(list_output_generic)\n\n        print(\"\\n--- Formatting Generic Website Data as Paragraphs ---\")\n        paragraph_output_generic = format_data_as_paragraphs(generic_website_data, \"generic_website\")\n        print(paragraph_output_generic)\n    else:\n        print(f\"\\nFailed to extract data from both primary and fallback generic URLs.\")\n\n    print(\"\\n\\nInformation Organizer Script demonstration finished.\")\n
\ No newline at end of file
+"""
+This script organizes and presents structured data extracted by other parser scripts
+in different text-based formats.
+"""
+
+import sys
+
+from web_parser import fetch_and_parse_website
+from text_summarizer import summarize_text, is_pipeline_available
+
+
+def format_data_as_list(data, source_type: str) -> str:
+    """
+    Formats extracted data as a human-readable list.
+
+    Args:
+        data: The structured data from parsing functions.
+              - If source_type is "futuretools", expects a list of tool dictionaries.
+              - If source_type is "generic_website", expects a dictionary from fetch_and_parse_website.
+        source_type: Either "futuretools" or "generic_website".
+
+    Returns:
+        A string containing the formatted list.
+    """
+    output_lines = []
+
+    if source_type == "futuretools":
+        output_lines.append("--- AI Tools (List Format) ---")
+        if not data:
+            output_lines.append("No tools data provided or tools list is empty.")
+        else:
+            # extract_tools_from_futuretools() always sets every key (to "N/A"
+            # when missing), so plain indexing is safe in this hot loop
+            append = output_lines.append
+            for i, tool in enumerate(data):
+                append(f"\nTool {i+1}:")
+                append(f"  Name: {tool['name']}")
+                append(f"  Website: {tool['website_link']}")
+
+        if isinstance(data, dict) and "youtube_videos" in data:
+            youtube_videos = data.get("youtube_videos", [])
+            if youtube_videos:
+                output_lines.append("\n--- YouTube Videos Found on Page ---")
+                for video in youtube_videos:
+                    output_lines.append(f"  Title: {video.get('title', 'N/A')}")
+                    output_lines.append(f"  URL: {video.get('url', 'N/A')}")
+
+    elif source_type == "generic_website":
+        output_lines.append("--- Website Content (List Format) ---")
+        if not data:
+            output_lines.append("No website data provided.")
+            return "\n".join(output_lines)
+
+        links = data.get("links", [])
+        if links:
+            output_lines.append("\n--- Hyperlinks ---")
+            for i, link in enumerate(links[:10]):
+                output_lines.append(f"  {i+1}. Text: {link.get('text', 'N/A')}")
+                output_lines.append(f"     Href: {link.get('href', 'N/A')}")
+        else:
+            output_lines.append("\nNo hyperlinks extracted.")
+
+        youtube_videos = data.get("youtube_videos", [])
+        if youtube_videos:
+            output_lines.append("\n--- YouTube Videos ---")
+            for i, video in enumerate(youtube_videos):
+                output_lines.append(f"  {i+1}. Title: {video.get('title', 'N/A')}")
+                output_lines.append(f"     URL: {video.get('url', 'N/A')}")
+        else:
+            output_lines.append("\nNo YouTube videos identified.")
+
+    else:
+        return "Invalid source_type provided. Use 'futuretools' or 'generic_website'."
+
+    return "\n".join(output_lines)
+
+
+def format_data_as_paragraphs(data, source_type: str) -> str:
+    """
+    Formats extracted data as human-readable paragraphs.
+
+    Args:
+        data: The structured data.
+              - If source_type is "futuretools", expects a list of tool dictionaries.
+              - If source_type is "generic_website", expects a dictionary from fetch_and_parse_website.
+        source_type: Either "futuretools" or "generic_website".
+
+    Returns:
+        A string containing the formatted paragraphs.
+    """
+    return "\n\n".join(_iter_paragraphs(data, source_type))
+
+
+def write_data_as_paragraphs(data, source_type: str, out) -> None:
+    """
+    Writes the paragraphs of format_data_as_paragraphs() straight to a stream.
+
+    Each paragraph is written as soon as it is produced, so the full output
+    is never held in memory at once.
+
+    Args:
+        data: The structured data (see format_data_as_paragraphs()).
+        source_type: Either "futuretools" or "generic_website".
+        out: A writable text stream, e.g. an open file or sys.stdout.
+    """
+    out.writelines(paragraph + "\n\n" for paragraph in _iter_paragraphs(data, source_type))
+
+
+def _iter_paragraphs(data, source_type: str):
+    """Yields the paragraphs for format_data_as_paragraphs() one at a time."""
+    if source_type == "futuretools":
+        yield "--- AI Tools (Paragraph Format) ---"
+        if not data:
+            yield "No tools data provided or tools list is empty."
+        else:
+            for tool in data:
+                name = tool.get('name', 'N/A')
+                desc = tool.get('summarized_description') or tool.get('description', 'No description available.')
+                website = tool.get('website_link', 'N/A')
+                ft_link = tool.get('futuretools_link', 'N/A')
+
+                parts = [f"Tool: {name}", f"Description: {desc}", f"Website: {website}"]
+                if ft_link != 'N/A':
+                    parts.append(f"FutureTools Page: {ft_link}")
+                yield "\n".join(parts) + "\n"
+
+    elif source_type == "generic_website":
+        yield "--- Website Content (Paragraph Format) ---"
+        if not data:
+            yield "No website data provided."
+            return
+
+        main_text = data.get("text", "")
+        # The model is only loaded here, once there is text to summarize; a
+        # failed load falls back to the snippet instead of an error string.
+        if main_text and is_pipeline_available(initialize=True):
+            summary = summarize_text(main_text, max_length=150, min_length=40)
+            yield f"Website Summary:\n{summary}"
+        elif main_text:
+            yield (
+                f"Website Summary:\n(Summarizer not available). "
+                f"Full text snippet:\n{main_text[:500]}..."
+            )
+        else:
+            yield "No main text content extracted to summarize."
+
+        links = data.get("links", [])
+        if links:
+            link_lines = ["Key Hyperlinks Found:"]
+            for link in links[:5]:
+                link_lines.append(f"- {link.get('text', 'N/A')} ({link.get('href', 'N/A')})")
+            if len(links) > 5:
+                link_lines.append(f"...and {len(links)-5} more links.")
+            else:
+                link_lines.append("")  # keep the trailing newline after the last link
+            yield "\n".join(link_lines)
+
+        youtube_videos = data.get("youtube_videos", [])
+        if youtube_videos:
+            yt_lines = ["YouTube Videos Found:"]
+            for video in youtube_videos:
+                yt_lines.append(f"- {video.get('title', 'N/A')} ({video.get('url', 'N/A')})")
+            yield "\n".join(yt_lines) + "\n"
+
+    else:
+        yield "Invalid source_type provided. Use 'futuretools' or 'generic_website'."
+
+
+if __name__ == '__main__':
+    # Lazy import to avoid triggering model load unless actually running this script
+    from futuretools_parser import extract_tools_from_futuretools
+
+    print("Demonstrating Information Organizer Script...\n")
+
+    # 1. Process data from Futuretools.io
+    print("="*30)
+    print("Fetching and processing from Futuretools.io...")
+    print("="*30)
+    futuretools_data = extract_tools_from_futuretools()
+
+    if futuretools_data:
+        print("\n--- Formatting Futuretools Data as List ---")
+        list_output_ft = format_data_as_list(futuretools_data, "futuretools")
+        print(list_output_ft)
+
+        print("\n--- Formatting Futuretools Data as Paragraphs ---")
+        write_data_as_paragraphs(futuretools_data, "futuretools", sys.stdout)
+    else:
+        print("\nNo data extracted from Futuretools.io. Skipping formatting for it.")
+
+    # 2. Process data from a generic website
+    print("\n\n" + "="*30)
+    print("Fetching and processing from a generic blog post...")
+    print("="*30)
+    generic_url = "https://openai.com/blog/new-models-and-developer-products-announced-at-devday"
+    generic_url_fallback = "https://www.gnu.org/philosophy/free-sw.html"
+
+    print(f"Attempting to fetch: {generic_url}")
+    generic_website_data = fetch_and_parse_website(generic_url)
+
+    if not generic_website_data:
+        print(f"Failed to fetch primary generic URL. Trying fallback: {generic_url_fallback}")
+        generic_website_data = fetch_and_parse_website(generic_url_fallback)
+
+    if generic_website_data:
+        print("\n--- Formatting Generic Website Data as List ---")
+        list_output_generic = format_data_as_list(generic_website_data, "generic_website")
+        print(list_output_generic)
+
+        print("\n--- Formatting Generic Website Data as Paragraphs ---")
+        write_data_as_paragraphs(generic_website_data, "generic_website", sys.stdout)
+    else:
+        print(f"\nFailed to extract data from both primary and fallback generic URLs.")
+
+    print("\n\nInformation Organizer Script demonstration finished.")
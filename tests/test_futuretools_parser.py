@@ -0,0 +1,84 @@
+import contextlib
+import io
+import unittest
+
+import futuretools_parser
+
+
+def _card(i: int, card_class: str = "tool-card", desc_class: str = "tool-card-description") -> str:
+    return (
+        f'<div class="{card_class}">'
+        f'<h3 class="tool-name">Tool {i}</h3>'
+        f'<a href="/tool/tool-{i}">Details</a>'
+        f'<a class="external-link" href="https://tool{i}.example/">Visit</a>'
+        f'<p class="{desc_class}">Tool {i} does a useful thing.</p>'
+        f'</div>'
+    )
+
+
+def _parse(html: str) -> list:
+    # _parse_tool_cards() prints a parsing summary for every page
+    with contextlib.redirect_stdout(io.StringIO()):
+        return futuretools_parser._parse_tool_cards(html.encode())
+
+
+class ToolCardTest(unittest.TestCase):
+    def assert_tools(self, tools: list, count: int):
+        self.assertEqual([tool["name"] for tool in tools], [f"Tool {i}" for i in range(count)])
+        for i, tool in enumerate(tools):
+            self.assertEqual(tool["futuretools_link"], f"https://www.futuretools.io/tool/tool-{i}")
+            self.assertEqual(tool["website_link"], f"https://tool{i}.example/")
+            self.assertEqual(tool["description"], f"Tool {i} does a useful thing.")
+
+    def test_flat_cards(self):
+        self.assert_tools(_parse("".join(_card(i) for i in range(5))), 5)
+
+    def test_cards_in_wrapper_with_matching_class(self):
+        html = '<div class="tool-cards-grid">' + "".join(_card(i) for i in range(5)) + '</div>'
+        self.assert_tools(_parse(html), 5)
+
+    def test_webflow_list_of_cards(self):
+        items = "".join(
+            f'<div role="listitem" class="collection-item w-dyn-item">{_card(i)}</div>'
+            for i in range(5)
+        )
+        html = f'<div class="w-dyn-list"><div role="list" class="w-dyn-items">{items}</div></div>'
+        self.assert_tools(_parse(html), 5)
+
+    def test_webflow_items_without_tool_cards(self):
+        items = "".join(_card(i, card_class="collection-item w-dyn-item", desc_class="item-description") for i in range(5))
+        html = f'<div class="w-dyn-list"><div role="list" class="w-dyn-items">{items}</div></div>'
+        self.assert_tools(_parse(html), 5)
+
+    def test_no_containers(self):
+        self.assertEqual(_parse("<p>nothing here</p>"), [])
+
+
+class FallbackLinkTest(unittest.TestCase):
+    def website_link(self, *hrefs: str) -> str:
+        # No .external-link anchor, so the link comes from the fallback selector
+        links = "".join(f'<a href="{href}">link</a>' for href in hrefs)
+        html = f'<div class="tool-card"><h3 class="tool-name">Tool</h3><a href="/tool/x">Details</a>{links}</div>'
+        return _parse(html)[0]["website_link"]
+
+    def test_skips_futuretools_hosts(self):
+        self.assertEqual(
+            self.website_link(
+                "https://www.futuretools.io/tool/x",
+                "https://blog.futuretools.io/post",
+                "HTTPS://WWW.FUTURETOOLS.IO/tools/x",
+                "http://futuretools.io",
+                "https://tool.example/?ref=futuretools.io",
+            ),
+            "https://tool.example/?ref=futuretools.io",
+        )
+
+    def test_skips_non_http_schemes(self):
+        self.assertEqual(self.website_link("httpfoo:bar", "HTTPS://Tool.example/"), "HTTPS://Tool.example/")
+
+    def test_no_external_link(self):
+        self.assertEqual(self.website_link("https://blog.futuretools.io/post"), "N/A")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import random
+import unittest
+
+import web_parser
+
+
+def _chunked(html: bytes, size: int) -> list:
+    return [html[start:start + size] for start in range(0, len(html), size)]
+
+
+class CharsetTest(unittest.TestCase):
+    PAGE = '<html><head>{}</head><body><p>Café 日本 <a href="https://example.com/">Café</a></p></body></html>'
+
+    def parse(self, html: bytes, charset: str = None) -> dict:
+        return web_parser._parse_chunks(_chunked(html, 7), "https://example.com/", charset=charset)
+
+    def test_undeclared_charset_is_utf8(self):
+        result = self.parse(self.PAGE.format("").encode("utf-8"))
+        self.assertEqual(result["text"], "Café 日本 Café")
+        self.assertEqual(result["links"][0]["text"], "Café")
+
+    def test_header_charset(self):
+        html = self.PAGE.format("").replace(" 日本", "").encode("iso-8859-1")
+        self.assertEqual(self.parse(html, charset="ISO-8859-1")["text"], "Café Café")
+
+    def test_header_charset_beats_meta(self):
+        html = self.PAGE.format('<meta charset="iso-8859-1">').encode("utf-8")
+        self.assertEqual(self.parse(html, charset="utf-8")["text"], "Café 日本 Café")
+
+    def test_meta_charset(self):
+        html = self.PAGE.format('<meta charset="euc-jp">').replace("Café", "日本").encode("euc-jp")
+        self.assertEqual(self.parse(html)["text"], "日本 日本 日本")
+
+    def test_unknown_header_charset_is_ignored(self):
+        result = self.parse(self.PAGE.format("").encode("utf-8"), charset="x-unknown")
+        self.assertEqual(result["text"], "Café 日本 Café")
+
+    def test_declared_charset(self):
+        self.assertEqual(web_parser._declared_charset('text/html; charset="UTF-8"'), "UTF-8")
+        self.assertIsNone(web_parser._declared_charset("text/html"))
+        self.assertIsNone(web_parser._declared_charset(None))
+
+
+def _generated_page() -> bytes:
+    """A long page mixing nested content, boilerplate, links, scripts, styles and comments."""
+    rng = random.Random(2)
+    openers = (
+        '<div class="c{0}">', '<p>', '<span>', '<div class="nav">',
+        '<i><a href="https://example.com/{0}">x</a>',
+        '<script>var a{0}="</sc"+"ript>";</script>', '<style>.a{0}{{}}</style>',
+        '<!-- c<script> -->', '<a href="https://youtu.be/{0}">v<b>{0}</b>',
+    )
+    parts = ['<html><body>']
+    for i in range(2000):
+        parts.append(rng.choice(openers).format(i) + 'w%d t%d' % (i, i))
+        if rng.random() < 0.5:
+            parts.append(rng.choice(('</div>', '</p>', '</span>', '</a>')) + 'tail%d' % i)
+    parts.append('</body></html>')
+    return ''.join(parts).encode()
+
+
+class ChunkingTest(unittest.TestCase):
+    """Streamed parsing must not depend on where the chunk boundaries fall."""
+
+    PAGES = (
+        b'<div data-x="<script>">visible1</div><p>visible2</p><script>x</script><p>visible3</p>',
+        b'<script-loader>a</script-loader><span>b</span><script>x</script>',
+        b'<html><head><title>about <script> tags</title></head>'
+        b'<body><span>after</span><style>p{}</style></body></html>',
+        b'<textarea>x<style>y</textarea><span>after</span><style>p{}</style>',
+        b'<html><body><p>a<script>var s="<style>x</style>";</script>b</p><!-- <script> -->'
+        b'<p>visible</p><SCRIPT type="x">y</SCRIPT >c<style>p{}</style></body></html>',
+        b'<html><body><p>unterminated<script>var x=1; <p>never</p>',
+        b'<html><body><p>t</p><!-- open comment <p>x</p>',
+        b'<main><p>a<a href="https://a.example/">A<a href="https://b.example/">B</a>C</a></p></main>',
+    )
+    CHUNK_SIZES = (1, 2, 3, 5, 7, 17, 64, 1000, 65536)
+
+    def assert_chunking_invariant(self, html: bytes) -> dict:
+        expected = web_parser._parse_chunks([html], "https://example.com/")
+        for size in self.CHUNK_SIZES:
+            with self.subTest(size=size):
+                result = web_parser._parse_chunks(_chunked(html, size), "https://example.com/")
+                self.assertEqual(result, expected)
+        return expected
+
+    def test_pages(self):
+        for html in self.PAGES:
+            with self.subTest(html=html[:40]):
+                self.assert_chunking_invariant(html)
+
+    def test_generated_page(self):
+        self.assert_chunking_invariant(_generated_page())
+
+    def test_visible_text_around_raw_elements(self):
+        texts = [web_parser._parse_chunks([html], "u")["text"] for html in self.PAGES[:5]]
+        self.assertEqual(texts[0], "visible1 visible2 visible3")
+        self.assertEqual(texts[1], "a b")
+        self.assertEqual(texts[2], "about <script> tags after")
+        self.assertEqual(texts[3], "x<style>y after")
+        self.assertEqual(texts[4], "a b visible")
+
+    def test_returned_tree_matches(self):
+        html = _generated_page()
+        expected = web_parser._parse_chunks([html], "u")
+        result = web_parser._parse_chunks(_chunked(html, 17), "u", return_tree=True)
+        self.assertIsNotNone(result.pop("tree"))
+        self.assertEqual(result, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
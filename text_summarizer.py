@@ -1 +1,675 @@
-"""\nThis script defines a function to summarize text using Hugging Face Transformers.\n\nNote: This script requires the 'transformers' library and one of its\nmachine learning framework backends (PyTorch or TensorFlow).\nYou can install them using pip:\n  pip install transformers\n  # For PyTorch (recommended for many models):\n  pip install torch\n  # Or for TensorFlow:\n  # pip install tensorflow\n"""\n\nfrom functools import lru_cache\n\n# Lazy-load the pipeline to avoid heavy import cost (~2-5s) when the module\n# is imported but summarization is never used (e.g. information_organizer\n# only formatting tool lists).\n_summarizer = None\n_init_attempted = False\n\n\ndef _get_summarizer():\n    \"\"\"Lazily initialize the summarization pipeline on first use.\"\"\"\n    global _summarizer, _init_attempted\n    if _init_attempted:\n        return _summarizer\n    _init_attempted = True\n    try:\n        from transformers import pipeline\n        _summarizer = pipeline(\"summarization\", model=\"t5-small\")\n    except Exception as e:\n        print(\n            f\"Error initializing Hugging Face pipeline. This might be due to \"\n            f\"missing dependencies or model download issues: {e}\"\n        )\n        print(\n            \"Please ensure 'torch' or 'tensorflow' is installed and you have \"\n            \"internet access for model download.\"\n        )\n    return _summarizer\n\n\n# Cache summarization results to avoid re-running the model on identical inputs.\n# maxsize=256 keeps the most recent 256 unique (text, max_length, min_length)\n# combinations in memory \u2014 a good trade-off for typical workloads.\n@lru_cache(maxsize=256)\ndef summarize_text(text: str, max_length: int = 150, min_length: int = 30) -> str:\n    \"\"\"\n    Summarizes the input text using a pre-trained Hugging Face model.\n\n    Args:\n        text: The text content to summarize.\n        max_length: The maximum length of the summary.\n        min_length: The minimum length of the summary.\n\n    Returns:\n        The summarized text as a string, or an error message if summarization fails.\n    \"\"\"\n    summarizer = _get_summarizer()\n\n    if not summarizer:\n        return \"Summarization pipeline not initialized. Please check installation and logs.\"\n\n    if not text or not isinstance(text, str) or len(text.strip()) == 0:\n        return \"Input text is empty or invalid.\"\n\n    words = text.split()\n    word_count = len(words)\n\n    if word_count < min_length:\n        print(\n            f\"Warning: Input text ({word_count} words) is shorter than the \"\n            f\"specified min_length ({min_length} words) for summarization. \"\n            f\"Summary might be suboptimal or longer than original.\"\n        )\n\n    try:\n        # t5-small has a max input sequence length of 512 tokens.\n        # Truncate long inputs to ~500 words to stay within limits and avoid\n        # wasting time on tokens the model will discard anyway.\n        if word_count > 500:\n            if word_count > 1000:\n                print(\"Warning: Input text is very long. Truncating to ~500 words for summarization.\")\n            text = \" \".join(words[:500])\n\n        summary_list = summarizer(text, max_length=max_length, min_length=min_length, do_sample=False)\n        return summary_list[0]['summary_text']\n    except Exception as e:\n        return f\"Error during summarization: {e}\"\n\n\n# Expose a way to check pipeline availability without triggering initialization\ndef is_pipeline_available() -> bool:\n    \"\"\"Check whether the summarizer pipeline is (or can be) available.\"\"\"\n    if _init_attempted:\n        return _summarizer is not None\n    # Not yet attempted \u2014 optimistically return True; actual init happens on first call\n    return True\n\n\nif __name__ == '__main__':\n    sample_text_short = (\n        \"Paris is the capital and most populous city of France, with an estimated population of \"\n        \"2,165,423 residents as of 1 January 2023 in an area of more than 105 square kilometres (41 square miles). \"\n        \"Since the 17th century, Paris has been one of the world's major centres of finance, diplomacy, commerce, \"\n        \"fashion, gastronomy, science, and arts. The City of Paris is the centre and seat of government of the \"\n        \"Ile-de-France, or Paris Region, which has an estimated population of 12,271,794 residents, or about 19% \"\n        \"of the population of France as of 2023.\"\n    )\n\n    sample_text_long = (\n        \"The James Webb Space Telescope (JWST) is a space telescope designed primarily to conduct infrared astronomy. \"\n        \"As the largest optical telescope in space, its significantly improved infrared resolution and sensitivity \"\n        \"allow it to view objects too old, distant, or faint for the Hubble Space Telescope. This is expected to \"\n        \"enable a broad range of investigations across the fields of astronomy and cosmology, such as observation \"\n        \"of the first stars and the formation of the first galaxies, and detailed atmospheric characterization of \"\n        \"potentially habitable exoplanets. JWST was launched by an Ariane 5 rocket from Kourou, French Guiana, in \"\n        \"December 2021 and entered orbit around the Sun at a Lagrange point (L2), about 1.5 million kilometers \"\n        \"(930,000 mi) from Earth, in January 2022. The first image from JWST was released to the public via a press \"\n        \"conference on 11 July 2022. The telescope is the successor to Hubble and is a collaboration between NASA, \"\n        \"the European Space Agency (ESA), and the Canadian Space Agency (CSA). \"\n        \"The development of JWST began in 1996 for a launch that was initially planned for 2007 with a US$500 million budget. \"\n        \"The project experienced numerous delays and cost overruns, and passed through a major redesign in 2005. \"\n        \"JWST's construction was completed in late 2016, after which it began an extensive testing phase. \"\n        \"The total cost of the project is estimated to be around US$10 billion, which includes the spacecraft's design \"\n        \"and development, its launch, and five years of operations. The telescope's primary mirror consists of 18 \"\n        \"hexagonal gold-plated beryllium segments that combine to create a 6.5-meter (21 ft) diameter mirror. \"\n        \"This large mirror, along with its advanced instruments, allows JWST to capture images of some of the most \"\n        \"distant objects in the universe. Scientists hope that JWST will help answer fundamental questions about \"\n        \"the universe, including how it began, how galaxies evolved, and whether life exists beyond Earth.\"\n    )\n\n    print(\"Attempting to summarize a short text:\")\n    summary1 = summarize_text(sample_text_short)\n    print(f\"\\nOriginal Text:\\n{sample_text_short}\")\n    print(f\"\\nSummary:\\n{summary1}\")\n\n    print(\"\\n\" + \"=\"*50 + \"\\n\")\n\n    print(\"Attempting to summarize a longer text:\")\n    summary2 = summarize_text(sample_text_long, max_length=100, min_length=25)\n    print(f\"\\nOriginal Text (Snippet):\\n{sample_text_long[:200]}...\")\n    print(f\"\\nSummary:\\n{summary2}\")\n\n    print(\"\\n\" + \"=\"*50 + \"\\n\")\n\n    # Demonstrate caching: second call with identical text should be instant\n    print(\"Re-summarizing same short text (should be cached / instant):\")\n    summary1_cached = summarize_text(sample_text_short)\n    print(f\"Summary (cached): {summary1_cached}\")\n\n    print(\"\\n\" + \"=\"*50 + \"\\n\")\n\n    print(\"Testing with empty text:\")\n    summary_empty = summarize_text(\"\")\n    print(f\"Summary for empty text: {summary_empty}\")\n\n    print(\"\\n\" + \"=\"*50 + \"\\n\")\n\n    print(\"Testing with text shorter than min_length (default 30):\")\n    sample_text_too_short = \"This is a very short text. It has only ten words.\"\n    summary_too_short = summarize_text(sample_text_too_short)\n    print(f\"\\nOriginal Text:\\n{sample_text_too_short}\")\n    print(f\"\\nSummary for too short text:\\n{summary_too_short}\")\n\n    if not is_pipeline_available():\n        print(\"\\nNote: The summarization pipeline could not be initialized.\")\n        print(\"Please check your Hugging Face Transformers installation and dependencies (torch/tensorflow).\")\n        print(\"You may need to run: pip install transformers torch (or tensorflow)\")\n
\ No newline at end of file
+"""
+This script defines a function to summarize text using Hugging Face Transformers.
+
+Note: This script requires the 'transformers' library with the PyTorch backend.
+You can install them using pip:
+  pip install transformers torch
+On CPU, the model runs through ONNX Runtime when 'optimum' is installed:
+  pip install optimum[onnxruntime]
+
+Backends:
+  - CUDA GPU: PyTorch, with bfloat16 weights where the GPU supports them.
+  - CPU with optimum: ONNX Runtime, exported once and int8-quantized.
+  - CPU without optimum, or if the ONNX export/load fails: PyTorch under
+    bfloat16 autocast on CPUs with AVX512-BF16/AMX, otherwise with
+    int8-quantized Linear layers.
+
+Environment variables, and the backends they apply to:
+  SUMMARIZER_MODEL      Checkpoint to load (all backends; default t5-small).
+  SUMMARIZER_INT8=0     Keep full-precision weights (ONNX Runtime, and
+                        PyTorch on CPUs without bfloat16 support).
+  SUMMARIZER_ONNX_DIR   Where the ONNX export is kept (ONNX Runtime only).
+  SUMMARIZER_COMPILE=1  torch.compile the encoder (PyTorch only; ignored
+                        with a warning when ONNX Runtime is used).
+"""
+
+import gc
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from typing import NamedTuple
+
+# t5-small (~60M parameters) is already smaller and faster than distilled BART
+# checkpoints such as sshleifer/distilbart-cnn-6-6 (~230M); set
+# SUMMARIZER_MODEL to try another summarization checkpoint without code changes.
+MODEL_NAME = os.environ.get("SUMMARIZER_MODEL", "t5-small")
+
+# Quantize Linear/MatMul weights to int8 on CPU; set SUMMARIZER_INT8=0 to
+# keep full-precision weights
+_QUANTIZE_INT8 = os.environ.get("SUMMARIZER_INT8", "1") != "0"
+
+# Where the ONNX export of MODEL_NAME is saved; the export only runs once.
+# The default directory is named after the model and precision; a directory
+# set in SUMMARIZER_ONNX_DIR is used exactly as given.
+_ONNX_DIR = os.environ.get("SUMMARIZER_ONNX_DIR") or os.path.join(
+    "onnx_models", MODEL_NAME.replace("/", "--") + ("-int8" if _QUANTIZE_INT8 else "")
+)
+
+# Compile the PyTorch encoder with torch.compile when SUMMARIZER_COMPILE=1
+# (the ONNX Runtime backend has no equivalent; see _load_model()).
+# Off by default: compiling takes tens of seconds, which only pays off in
+# long-running processes that summarize many texts.
+_COMPILE_ENCODER = os.environ.get("SUMMARIZER_COMPILE", "0") == "1"
+
+# The input limit is read from the tokenizer's model_max_length when the
+# model loads (512 for t5-small). Tokenizers that declare no limit report a
+# huge sentinel instead, and get the default; declared limits above the cap
+# are clamped, since encoder cost grows quadratically with input length.
+_DEFAULT_MAX_INPUT_TOKENS = 512
+_MAX_INPUT_TOKENS_CAP = 4096
+
+# Sentence boundaries that chunks prefer to break at
+_split_sentences = re.compile(r"(?<=[.!?])\s+").split
+
+# Summaries of recent inputs, most recently used last, keyed by
+# (BLAKE2b digest of the text, max_length, min_length, num_beams). Keying on
+# a 16-byte digest means the cache never holds or compares the input texts.
+_summary_cache = OrderedDict()
+_SUMMARY_CACHE_SIZE = 256
+# Guards every lookup/insert/evict sequence on _summary_cache, since
+# summaries may be requested from several threads (e.g. web handlers). It is
+# never held while the model runs.
+_summary_cache_lock = threading.Lock()
+
+# Returned by summarize_texts() in place of a summary; see is_summary_error()
+_NOT_INITIALIZED_MESSAGE = "Summarization pipeline not initialized. Please check installation and logs."
+_INVALID_INPUT_MESSAGE = "Input text is empty or invalid."
+_ERROR_PREFIX = "Error during summarization: "
+
+
+class _Summarizer(NamedTuple):
+    """The loaded tokenizer/model pair plus the task prefix and input limits the model expects."""
+    tokenizer: object
+    model: object
+    prefix: str
+    # Inputs are truncated at max_input_tokens; longer texts are first split
+    # into chunks of at most chunk_tokens (see _input_limits())
+    max_input_tokens: int
+    chunk_tokens: int
+
+
+# Context manager wrapped around every model call; torch.inference_mode once
+# the model is loaded, plus bfloat16 autocast on capable CPUs.
+_inference_mode = nullcontext
+
+
+def _prepare_torch_model(model):
+    """
+    Moves the model to the best device and switches it to inference-only,
+    reduced-precision use.
+
+    bfloat16 halves weight and activation bandwidth where the hardware supports
+    it natively. float16 is deliberately not used: T5 activations overflow it.
+    On GPUs the weights are cast to bfloat16. On CPUs with AVX512-BF16 or AMX
+    the weights stay float32 and matmuls run under bfloat16 autocast, which
+    keeps T5's layer norms and softmax in float32. Other CPUs get dynamically
+    quantized int8 Linear layers instead.
+    """
+    global _inference_mode
+    import torch
+
+    _inference_mode = torch.inference_mode
+
+    if torch.cuda.is_available():
+        model = model.to("cuda")
+        if torch.cuda.is_bf16_supported():
+            model = model.to(dtype=torch.bfloat16)
+    elif _cpu_supports_bf16(torch):
+        @contextmanager
+        def bf16_inference():
+            with torch.inference_mode(), torch.autocast("cpu", dtype=torch.bfloat16):
+                yield
+
+        _inference_mode = bf16_inference
+    elif _QUANTIZE_INT8:
+        # Batch-1 generation is bound by weight bandwidth; int8 weights move
+        # a quarter of the bytes and use VNNI dot products where available
+        model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    model.eval()
+    if _COMPILE_ENCODER:
+        _compile_encoder(torch, model)
+    return model
+
+
+def _compile_encoder(torch, model):
+    """
+    Replaces model.encoder with a torch.compile'd version where that works.
+
+    Fusing the encoder's elementwise ops (layer norm, residual adds,
+    activations) into the neighbouring kernels saves a round trip to memory
+    per op. Compilation happens lazily, so a dummy forward pass runs it here
+    rather than on the first real request; if it fails, the eager encoder is
+    kept. The decoder is left eager: generate() calls it once per token with
+    a growing cache, which would keep triggering recompiles.
+    """
+    encoder = model.encoder
+    try:
+        # CUDA graphs ("reduce-overhead") only pay off on the GPU
+        mode = "reduce-overhead" if model.device.type == "cuda" else "default"
+        model.encoder = torch.compile(encoder, mode=mode, dynamic=True)
+        dummy_ids = torch.zeros((1, 8), dtype=torch.long, device=model.device)
+        with _inference_mode():
+            model.encoder(input_ids=dummy_ids)
+    except Exception as e:
+        print(f"torch.compile unavailable, using the eager encoder: {e}")
+        model.encoder = encoder
+
+
+def _cpu_supports_bf16(torch) -> bool:
+    """Checks for native bfloat16 matmul support (AVX512-BF16 or AMX) on the CPU."""
+    # Private helpers, so guard against them missing in other torch versions
+    for name in ("_is_avx512_bf16_supported", "_is_amx_tile_supported"):
+        check = getattr(torch.cpu, name, None)
+        if check is not None and check():
+            return True
+    return False
+
+
+def _load_ort_model():
+    """
+    Loads MODEL_NAME as an ONNX Runtime model, exporting it on first use.
+
+    ORT_ENABLE_ALL fuses LayerNorm/attention/activation subgraphs and folds
+    constants, which cuts per-layer kernel and Python overhead on CPU.
+    Raises ImportError if optimum/onnxruntime are not installed.
+    """
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+
+    if not os.path.isdir(_ONNX_DIR):
+        _export_onnx(ORTModelForSeq2SeqLM, _ONNX_DIR)
+
+    return ORTModelForSeq2SeqLM.from_pretrained(_ONNX_DIR, session_options=options)
+
+
+def _export_onnx(model_class, onnx_dir: str):
+    """
+    Exports MODEL_NAME to `onnx_dir`, int8-quantized if _QUANTIZE_INT8 is set.
+
+    The export is written to a temporary directory next to `onnx_dir` and
+    renamed into place once it is complete, so an interrupted export or
+    quantization never leaves a directory that later runs would load as is.
+    """
+    parent = os.path.dirname(os.path.abspath(onnx_dir))
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=os.path.basename(onnx_dir) + ".", dir=parent)
+    try:
+        model_class.from_pretrained(MODEL_NAME, export=True).save_pretrained(tmp_dir)
+        if _QUANTIZE_INT8:
+            _quantize_onnx_dir(tmp_dir)
+        os.replace(tmp_dir, onnx_dir)
+    except OSError:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        # Another process may have finished the same export first
+        if not os.path.isdir(onnx_dir):
+            raise
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def _quantize_onnx_dir(onnx_dir: str):
+    """
+    Replaces every exported ONNX graph in `onnx_dir` with a dynamically
+    int8-quantized copy.
+
+    Signed int8 weights let ONNX Runtime use its AVX512-VNNI kernels on CPUs
+    that have them.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    for name in os.listdir(onnx_dir):
+        if not name.endswith(".onnx"):
+            continue
+        path = os.path.join(onnx_dir, name)
+        tmp_path = path + ".int8"
+        quantize_dynamic(path, tmp_path, weight_type=QuantType.QInt8)
+        os.replace(tmp_path, path)
+
+
+def _load_model():
+    """Returns ONNX Runtime on CPU when available, otherwise the PyTorch model."""
+    import torch
+
+    if not torch.cuda.is_available():
+        try:
+            model = _load_ort_model()
+        except ImportError:
+            pass
+        except Exception as e:
+            # A failed export, quantization or session load (e.g. a stale or
+            # corrupted ONNX directory) should not cost us summarization.
+            print(f"Warning: ONNX Runtime backend failed, falling back to PyTorch: {e}")
+        else:
+            if _COMPILE_ENCODER:
+                print(
+                    "Warning: SUMMARIZER_COMPILE only applies to the PyTorch backend "
+                    "and is ignored under ONNX Runtime."
+                )
+            return model
+
+    from transformers import AutoModelForSeq2SeqLM
+    return _prepare_torch_model(AutoModelForSeq2SeqLM.from_pretrained(MODEL_NAME))
+
+
+# Lazy-load the model to avoid heavy import cost (~2-5s) when the module
+# is imported but summarization is never used (e.g. information_organizer
+# only formatting tool lists). The cache holds the single result, including
+# None after a failed load, so loading is attempted once per process.
+@lru_cache(maxsize=1)
+def _load_summarizer():
+    """Lazily load the tokenizer and model on first use."""
+    try:
+        # Direct tokenizer + model.generate() calls skip the per-call
+        # preprocessing/dispatch/postprocessing layers of pipeline()
+        from transformers import AutoTokenizer
+        # The Rust-backed fast tokenizer encodes whole batches in parallel
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, use_fast=True)
+        model = _load_model()
+        # T5 checkpoints expect "summarize: " in front of the text; the
+        # summarization pipeline used to add it from the model config
+        task_params = (model.config.task_specific_params or {}).get("summarization", {})
+        return _Summarizer(
+            tokenizer, model, task_params.get("prefix", ""), *_input_limits(tokenizer)
+        )
+    except Exception as e:
+        print(
+            f"Error initializing Hugging Face model. This might be due to "
+            f"missing dependencies or model download issues: {e}"
+        )
+        print(
+            "Please ensure 'torch' is installed and you have "
+            "internet access for model download."
+        )
+        return None
+
+
+def _input_limits(tokenizer) -> tuple:
+    """
+    Returns (max input tokens, chunk tokens) for the model behind `tokenizer`.
+
+    Chunks are about 78% of the input limit (400 of t5-small's 512 tokens),
+    leaving room for the task prefix and end-of-sequence token.
+    """
+    limit = getattr(tokenizer, "model_max_length", None) or 0
+    # Unset limits are reported as transformers' VERY_LARGE_INTEGER (1e30)
+    if limit <= 0 or limit > 1_000_000:
+        limit = _DEFAULT_MAX_INPUT_TOKENS
+    limit = min(limit, _MAX_INPUT_TOKENS_CAP)
+    return limit, limit * 25 // 32
+
+
+# lru_cache does not stop concurrent first calls from each running the
+# loader, and simultaneous from_pretrained() calls can fail; the lock makes
+# other threads wait for the first load instead.
+_load_lock = threading.Lock()
+
+
+def _get_summarizer():
+    """Returns the loaded _Summarizer, or None if the model could not be loaded."""
+    with _load_lock:
+        return _load_summarizer()
+
+
+def preload_summarizer() -> bool:
+    """
+    Loads the model now instead of on first use.
+
+    Call this in a server's parent process before it forks its workers
+    (gunicorn/uwsgi pre-fork, multiprocessing's "fork" start method, the
+    Linux default). The children then inherit the loaded CPU weights as
+    copy-on-write pages and share one copy instead of each loading its own.
+    gc.freeze() moves everything loaded so far out of the garbage
+    collector's reach, so collections in the children don't write to those
+    objects and copy their pages.
+
+    With the "spawn" start method (the macOS and Windows default) every
+    worker re-imports this module and loads its own copy on first use;
+    preloading in the parent does not help there. Don't preload before
+    forking when the model runs on a GPU: CUDA cannot be used in a child
+    forked after it was initialized.
+
+    Returns:
+        True if the model is available.
+    """
+    available = _get_summarizer() is not None
+    gc.freeze()
+    return available
+
+
+def summarize_text(text: str, max_length: int = 150, min_length: int = 30,
+                   num_beams: int = 1) -> str:
+    """
+    Summarizes the input text using a pre-trained Hugging Face model.
+
+    Text longer than the model's input limit is not truncated: it is split
+    into sentence-aligned chunks, the chunks are summarized in batches, and
+    the joined chunk summaries are summarized again (repeating while they
+    are still too long) before the final pass. Results are cached, so
+    repeating a request returns immediately.
+
+    Args:
+        text: The text content to summarize.
+        max_length: The maximum length of the summary.
+        min_length: The minimum length of the summary.
+        num_beams: Beam width. 1 (greedy) is fastest; larger values trade
+                   roughly proportional decoder time for somewhat better summaries.
+
+    Returns:
+        The summarized text as a string, or an error message if summarization fails.
+    """
+    # isspace() stops at the first visible character instead of copying the
+    # whole text the way strip() does
+    if isinstance(text, str) and text and not text.isspace():
+        # Only feeds a warning, so counting spaces is close enough and avoids
+        # building a list of every word of a long page
+        word_count = text.count(" ") + 1
+
+        if word_count < min_length:
+            print(
+                f"Warning: Input text ({word_count} words) is shorter than the "
+                f"specified min_length ({min_length} words) for summarization. "
+                f"Summary might be suboptimal or longer than original."
+            )
+
+    # A batch of one through the batched path; empty/invalid input and
+    # initialization errors are reported by summarize_texts()
+    return summarize_texts([text], max_length, min_length, batch_size=1, num_beams=num_beams)[0]
+
+
+def summarize_texts(texts: list, max_length: int = 150, min_length: int = 30,
+                    batch_size: int = 8, num_beams: int = 1) -> list:
+    """
+    Summarizes several texts with batched model calls.
+
+    Texts are tokenized and run through the model `batch_size` at a time
+    instead of paying the per-call overhead once per text. Cached and
+    repeated texts are only summarized once; long texts are reduced the same
+    way as in summarize_text().
+
+    Args:
+        texts: The text contents to summarize.
+        max_length: The maximum length of each summary.
+        min_length: The minimum length of each summary.
+        batch_size: How many texts the model processes per forward pass.
+        num_beams: Beam width; see summarize_text().
+
+    Returns:
+        A list of summaries (or error messages, see is_summary_error()) in
+        the same order as `texts`.
+    """
+    summarizer = _get_summarizer()
+
+    if not summarizer:
+        return [_NOT_INITIALIZED_MESSAGE] * len(texts)
+
+    results = [_INVALID_INPUT_MESSAGE] * len(texts)
+    valid = [i for i, t in enumerate(texts) if isinstance(t, str) and t and not t.isspace()]
+    if not valid:
+        return results
+
+    try:
+        summaries = _summarize_cached(
+            summarizer, [texts[i] for i in valid], max_length, min_length, batch_size, num_beams
+        )
+    except Exception as e:
+        for i in valid:
+            results[i] = f"{_ERROR_PREFIX}{e}"
+        return results
+
+    for i, summary in zip(valid, summaries):
+        results[i] = summary
+    return results
+
+
+def is_summary_error(summary: str) -> bool:
+    """
+    True if `summary` is one of the error messages summarize_texts() returns
+    in place of a summary.
+    """
+    return (
+        summary in (_NOT_INITIALIZED_MESSAGE, _INVALID_INPUT_MESSAGE)
+        or summary.startswith(_ERROR_PREFIX)
+    )
+
+
+def summarizer_fingerprint() -> str:
+    """
+    Identifies the model and settings that produce this process's summaries,
+    without loading the model.
+
+    Callers that persist summaries include it in their cache keys, so a
+    different SUMMARIZER_MODEL or SUMMARIZER_INT8 setting does not reuse
+    summaries made by another configuration.
+    """
+    return f"{MODEL_NAME} int8={_QUANTIZE_INT8}"
+
+
+def _cache_key(text: str, max_length: int, min_length: int, num_beams: int) -> tuple:
+    """Builds the _summary_cache key for one summarization request."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    return digest, max_length, min_length, num_beams
+
+
+def _summarize_cached(summarizer, texts: list, max_length: int, min_length: int,
+                      batch_size: int, num_beams: int) -> list:
+    """
+    Returns summaries for `texts`, running the model only for texts that are
+    not in _summary_cache (each distinct text once). Raises on failure.
+    """
+    keys = [_cache_key(text, max_length, min_length, num_beams) for text in texts]
+    summaries = [None] * len(texts)
+    pending = {}
+    with _summary_cache_lock:
+        for i, key in enumerate(keys):
+            summary = _summary_cache.get(key)
+            if summary is None:
+                pending.setdefault(key, []).append(i)
+            else:
+                _summary_cache.move_to_end(key)
+                summaries[i] = summary
+    if not pending:
+        return summaries
+
+    inputs = [
+        _reduce_to_one_chunk(summarizer, texts[indices[0]], num_beams)
+        for indices in pending.values()
+    ]
+    new_summaries = _summarize_batch(
+        summarizer, inputs, max_length, min_length, batch_size, num_beams
+    )
+    with _summary_cache_lock:
+        for (key, indices), summary in zip(pending.items(), new_summaries):
+            _summary_cache[key] = summary
+            for i in indices:
+                summaries[i] = summary
+        while len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+            _summary_cache.popitem(last=False)
+    return summaries
+
+
+def _summarize_batch(summarizer, texts: list, max_length: int, min_length: int,
+                     batch_size: int, num_beams: int = 1) -> list:
+    """Runs model.generate() over `texts` in batches and returns the summary strings. Raises on failure."""
+    tokenizer, model, prefix = summarizer.tokenizer, summarizer.model, summarizer.prefix
+    # Group texts of similar length so each padded batch wastes few tokens
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    summaries = [None] * len(texts)
+    for start in range(0, len(order), batch_size):
+        indices = order[start:start + batch_size]
+        batch = [prefix + texts[i] for i in indices]
+        # truncation=True cuts inputs at the model's input limit
+        inputs = tokenizer(
+            batch, return_tensors="pt", padding=True,
+            truncation=True, max_length=summarizer.max_input_tokens
+        ).to(model.device)
+        # use_cache keeps the decoder's past keys/values between steps, so
+        # each new token only attends from itself instead of re-running the
+        # whole prefix; early_stopping only applies to beam search
+        with _inference_mode():
+            output_ids = model.generate(
+                **inputs, max_length=max_length, min_length=min_length,
+                num_beams=num_beams, early_stopping=num_beams > 1,
+                do_sample=False, use_cache=True
+            )
+        for i, summary in zip(indices, tokenizer.batch_decode(output_ids, skip_special_tokens=True)):
+            summaries[i] = summary
+    return summaries
+
+
+def _chunk_text(text: str, tokenizer, max_tokens: int) -> list:
+    """
+    Splits `text` into pieces of at most `max_tokens` tokens.
+
+    Whole sentences are packed into each piece; a single sentence longer than
+    `max_tokens` is cut at token boundaries. All sentences are tokenized in
+    one batched tokenizer call.
+    """
+    sentences = _split_sentences(text.strip())
+    # verbose=False: over-long sentences are expected here and cut below
+    sentence_ids = tokenizer(sentences, add_special_tokens=False, verbose=False)["input_ids"]
+
+    chunks = []
+    current, current_tokens = [], 0
+    for sentence, ids in zip(sentences, sentence_ids):
+        if current and current_tokens + len(ids) > max_tokens:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        if len(ids) > max_tokens:
+            for start in range(0, len(ids), max_tokens):
+                chunks.append(tokenizer.decode(ids[start:start + max_tokens], skip_special_tokens=True))
+            continue
+        current.append(sentence)
+        current_tokens += len(ids)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def _reduce_to_one_chunk(summarizer, text: str, num_beams: int = 1) -> str:
+    """
+    Map-reduce step for long inputs: returns `text` unchanged if it fits in one
+    chunk, else the joined chunk summaries, re-summarized until they fit.
+
+    Each round shrinks the text at least five-fold (e.g. t5-small's 400-token
+    chunks to 80-token summaries), so even very long pages need only a few
+    rounds. Raises on model errors.
+    """
+    chunk_tokens = summarizer.chunk_tokens
+    # A token almost always covers at least one character, and a chunk leaves
+    # headroom below the model limit, so text this short is not worth
+    # tokenizing here
+    if len(text) <= chunk_tokens:
+        return text
+    summary_tokens = min(80, chunk_tokens // 5)
+    chunks = _chunk_text(text, summarizer.tokenizer, chunk_tokens)
+    while len(chunks) > 1:
+        chunk_summaries = _summarize_batch(
+            summarizer, chunks, max_length=summary_tokens,
+            min_length=summary_tokens // 4, batch_size=8, num_beams=num_beams
+        )
+        text = " ".join(chunk_summaries)
+        chunks = _chunk_text(text, summarizer.tokenizer, chunk_tokens)
+    return text
+
+
+# Expose a way to check model availability without triggering initialization
+def is_pipeline_available(initialize: bool = False) -> bool:
+    """
+    Check whether the summarizer model is (or can be) available.
+
+    Args:
+        initialize: Load the model now if that has not been attempted yet,
+                    so the answer is definite. Callers should only pass True
+                    once they know they have text to summarize.
+    """
+    if _load_summarizer.cache_info().currsize:
+        return _get_summarizer() is not None
+    if initialize:
+        return _get_summarizer() is not None
+    # Not yet attempted — optimistically return True; actual init happens on first call
+    return True
+
+
+if __name__ == '__main__':
+    sample_text_short = (
+        "Paris is the capital and most populous city of France, with an estimated population of "
+        "2,165,423 residents as of 1 January 2023 in an area of more than 105 square kilometres (41 square miles). "
+        "Since the 17th century, Paris has been one of the world's major centres of finance, diplomacy, commerce, "
+        "fashion, gastronomy, science, and arts. The City of Paris is the centre and seat of government of the "
+        "Ile-de-France, or Paris Region, which has an estimated population of 12,271,794 residents, or about 19% "
+        "of the population of France as of 2023."
+    )
+
+    sample_text_long = (
+        "The James Webb Space Telescope (JWST) is a space telescope designed primarily to conduct infrared astronomy. "
+        "As the largest optical telescope in space, its significantly improved infrared resolution and sensitivity "
+        "allow it to view objects too old, distant, or faint for the Hubble Space Telescope. This is expected to "
+        "enable a broad range of investigations across the fields of astronomy and cosmology, such as observation "
+        "of the first stars and the formation of the first galaxies, and detailed atmospheric characterization of "
+        "potentially habitable exoplanets. JWST was launched by an Ariane 5 rocket from Kourou, French Guiana, in "
+        "December 2021 and entered orbit around the Sun at a Lagrange point (L2), about 1.5 million kilometers "
+        "(930,000 mi) from Earth, in January 2022. The first image from JWST was released to the public via a press "
+        "conference on 11 July 2022. The telescope is the successor to Hubble and is a collaboration between NASA, "
+        "the European Space Agency (ESA), and the Canadian Space Agency (CSA). "
+        "The development of JWST began in 1996 for a launch that was initially planned for 2007 with a US$500 million budget. "
+        "The project experienced numerous delays and cost overruns, and passed through a major redesign in 2005. "
+        "JWST's construction was completed in late 2016, after which it began an extensive testing phase. "
+        "The total cost of the project is estimated to be around US$10 billion, which includes the spacecraft's design "
+        "and development, its launch, and five years of operations. The telescope's primary mirror consists of 18 "
+        "hexagonal gold-plated beryllium segments that combine to create a 6.5-meter (21 ft) diameter mirror. "
+        "This large mirror, along with its advanced instruments, allows JWST to capture images of some of the most "
+        "distant objects in the universe. Scientists hope that JWST will help answer fundamental questions about "
+        "the universe, including how it began, how galaxies evolved, and whether life exists beyond Earth."
+    )
+
+    print("Attempting to summarize a short text:")
+    summary1 = summarize_text(sample_text_short)
+    print(f"\nOriginal Text:\n{sample_text_short}")
+    print(f"\nSummary:\n{summary1}")
+
+    print("\n" + "="*50 + "\n")
+
+    print("Attempting to summarize a longer text:")
+    summary2 = summarize_text(sample_text_long, max_length=100, min_length=25)
+    print(f"\nOriginal Text (Snippet):\n{sample_text_long[:200]}...")
+    print(f"\nSummary:\n{summary2}")
+
+    print("\n" + "="*50 + "\n")
+
+    # Demonstrate caching: second call with identical text should be instant
+    print("Re-summarizing same short text (should be cached / instant):")
+    summary1_cached = summarize_text(sample_text_short)
+    print(f"Summary (cached): {summary1_cached}")
+
+    print("\n" + "="*50 + "\n")
+
+    print("Testing with empty text:")
+    summary_empty = summarize_text("")
+    print(f"Summary for empty text: {summary_empty}")
+
+    print("\n" + "="*50 + "\n")
+
+    print("Testing with text shorter than min_length (default 30):")
+    sample_text_too_short = "This is a very short text. It has only ten words."
+    summary_too_short = summarize_text(sample_text_too_short)
+    print(f"\nOriginal Text:\n{sample_text_too_short}")
+    print(f"\nSummary for too short text:\n{summary_too_short}")
+
+    if not is_pipeline_available():
+        print("\nNote: The summarization pipeline could not be initialized.")
+        print("Please check your Hugging Face Transformers installation and dependencies (torch).")
+        print("You may need to run: pip install transformers torch")